@@ -1,13 +1,20 @@
 use cel_interpreter::objects::{Key, TryIntoValue};
-use cel_interpreter::{Context, Program, Value};
+use cel_interpreter::{Context, ExecutionError, Program, Value};
 use log::debug;
-use pyo3::exceptions::PyValueError;
+use lru::LruCache;
+use pyo3::exceptions::{PyTypeError, PyValueError};
 use pyo3::prelude::*;
-use pyo3::types::{PyDateTime, PyDelta, PyDeltaAccess, PyDict, PyList, PyTuple};
-use std::collections::HashMap;
+use pyo3::types::{
+    PyBool, PyBytes, PyDateTime, PyDelta, PyDeltaAccess, PyDict, PyFloat, PyFrozenSet, PyList,
+    PyLong, PyString, PyTuple,
+};
+use std::collections::hash_map::Entry;
+use std::collections::{HashMap, HashSet};
+use std::env;
 use std::error::Error;
 use std::fmt;
-use std::sync::Arc;
+use std::num::NonZeroUsize;
+use std::sync::{Arc, Mutex, OnceLock, RwLock};
 use pyo3::chrono;
 use pyo3::ffi::PyDateTime_Delta;
 
@@ -83,6 +90,30 @@ impl fmt::Display for CelError {
 }
 impl Error for CelError {}
 
+/// Borrow the UTF-8 contents of a Python str without an intermediate String
+fn py_str(value: &PyString) -> Result<&str, CelError> {
+    value
+        .to_str()
+        .map_err(|_| CelError::ConversionError("Failed to convert PyString to UTF-8".to_string()))
+}
+
+/// Convert the exact built-in scalar types with a single type check each
+/// Returns None for anything else, including subclasses, which take the general path
+fn exact_scalar_value(pyobject: &PyAny) -> Option<Value> {
+    if let Ok(value) = pyobject.downcast_exact::<PyBool>() {
+        Some(Value::Bool(value.is_true()))
+    } else if pyobject.is_exact_instance_of::<PyLong>() {
+        // Ints outside the i64 range fall through to the general path
+        pyobject.extract::<i64>().ok().map(Value::Int)
+    } else if let Ok(value) = pyobject.downcast_exact::<PyFloat>() {
+        Some(Value::Float(value.value()))
+    } else if let Ok(value) = pyobject.downcast_exact::<PyBytes>() {
+        Some(Value::Bytes(value.as_bytes().to_vec().into()))
+    } else {
+        None
+    }
+}
+
 /// We can't implement TryIntoValue for PyAny, so we implement for our wrapper RustyPyType
 impl TryIntoValue for RustyPyType<'_> {
     type Error = CelError;
@@ -90,19 +121,12 @@ impl TryIntoValue for RustyPyType<'_> {
     fn try_into_value(self) -> Result<Value, Self::Error> {
         let val = match self {
             RustyPyType(pyobject) => {
-                if let Ok(value) = pyobject.extract::<i64>() {
-                    Ok(Value::Int(value))
-                } else if let Ok(value) = pyobject.extract::<f64>() {
-                    Ok(Value::Float(value))
-                } else if let Ok(value) = pyobject.extract::<bool>() {
-                    Ok(Value::Bool(value))
-                // TODO: Implement these conversions
-                    // } else if let Ok(value) = pyobject.downcast::<PyDateTime>() {
-                //     Ok(Value::Timestamp(value.into()))
-                // } else if let Ok(value) = pyobject.downcast::<PyDelta>() {
-                //     Ok(Value::Duration(value.into()))
-                } else if let Ok(value) = pyobject.extract::<String>() {
-                    Ok(Value::String(value.into()))
+                // Type checks come before extractions: a failed extract raises and
+                // allocates a Python exception, a failed downcast is a pointer compare
+                if let Some(value) = exact_scalar_value(pyobject) {
+                    Ok(value)
+                } else if let Ok(value) = pyobject.downcast::<PyString>() {
+                    Ok(Value::String(py_str(value)?.to_owned().into()))
                 } else if let Ok(value) = pyobject.downcast::<PyList>() {
                         let list = value
                             .iter()
@@ -118,14 +142,14 @@ impl TryIntoValue for RustyPyType<'_> {
                 } else if let Ok(value) = pyobject.downcast::<PyDict>() {
                     let mut map: HashMap<Key, Value> = HashMap::new();
                     for (key, value) in value.into_iter() {
-                        let key = if let Ok(k) = key.extract::<i64>() {
+                        let key = if let Ok(k) = key.downcast::<PyString>() {
+                            Key::String(py_str(k)?.to_owned().into())
+                        } else if let Ok(k) = key.extract::<i64>() {
                             Key::Int(k)
                         } else if let Ok(k) = key.extract::<u64>() {
                             Key::Uint(k)
                         } else if let Ok(k) = key.extract::<bool>() {
                             Key::Bool(k)
-                        } else if let Ok(k) = key.extract::<String>() {
-                            Key::String(k.into())
                         } else {
                             return Err(CelError::ConversionError(
                                 "Failed to convert PyDict key to Key".to_string(),
@@ -144,6 +168,18 @@ impl TryIntoValue for RustyPyType<'_> {
                         }
                     }
                     Ok(Value::Map(map.into()))
+                // Subclasses of int and float, and objects implementing __index__ or __float__
+                } else if let Ok(value) = pyobject.extract::<i64>() {
+                    Ok(Value::Int(value))
+                } else if let Ok(value) = pyobject.extract::<f64>() {
+                    Ok(Value::Float(value))
+                } else if let Ok(value) = pyobject.extract::<bool>() {
+                    Ok(Value::Bool(value))
+                // TODO: Implement these conversions
+                    // } else if let Ok(value) = pyobject.downcast::<PyDateTime>() {
+                //     Ok(Value::Timestamp(value.into()))
+                // } else if let Ok(value) = pyobject.downcast::<PyDelta>() {
+                //     Ok(Value::Duration(value.into()))
                 } else if let Ok(value) = pyobject.extract::<Vec<u8>>() {
                     Ok(Value::Bytes(value.into()))
                 } else {
@@ -157,78 +193,556 @@ impl TryIntoValue for RustyPyType<'_> {
     }
 }
 
-/// Evaluate a CEL expression
-/// Returns a String representation of the result
-#[pyfunction]
-fn evaluate(src: String, context: Option<&PyDict>) -> PyResult<RustyCelType> {
-    debug!("Evaluating CEL expression: {}", src);
-    debug!("Context: {:?}", context);
+/// Number of compiled programs kept when `CEL_EVAL_CACHE_SIZE` is not set
+const DEFAULT_CACHE_SIZE: usize = 1024;
 
-    let program = Program::compile(src.as_str());
+/// Bounded LRU cache of compiled programs, keyed by expression source
+struct ProgramCache {
+    programs: LruCache<String, Arc<CompiledProgram>>,
+    hits: usize,
+    misses: usize,
+}
+
+static PROGRAM_CACHE: OnceLock<Option<Mutex<ProgramCache>>> = OnceLock::new();
+
+/// The process wide program cache, or None if disabled with `CEL_EVAL_CACHE_SIZE=0`
+fn program_cache() -> Option<&'static Mutex<ProgramCache>> {
+    PROGRAM_CACHE
+        .get_or_init(|| {
+            let size = env::var("CEL_EVAL_CACHE_SIZE")
+                .ok()
+                .and_then(|size| size.parse::<usize>().ok())
+                .unwrap_or(DEFAULT_CACHE_SIZE);
+            debug!("Program cache size: {}", size);
+            NonZeroUsize::new(size).map(|size| {
+                Mutex::new(ProgramCache {
+                    programs: LruCache::new(size),
+                    hits: 0,
+                    misses: 0,
+                })
+            })
+        })
+        .as_ref()
+}
+
+/// A compiled program and the names of the context variables it reads
+struct CompiledProgram {
+    program: Program,
+    /// Variables reported by `Program::references` at compile time, plus any the
+    /// program was later found to read. Replaced rather than mutated, so a run can
+    /// hold on to a snapshot without holding the lock.
+    variables: RwLock<Arc<HashSet<String>>>,
+}
 
-    // Handle the result of the compilation
-    match program {
-        Err(compile_error) => {
+impl CompiledProgram {
+    fn new(program: Program) -> Self {
+        let variables = program
+            .references()
+            .variables()
+            .into_iter()
+            .map(str::to_owned)
+            .collect();
+        CompiledProgram {
+            program,
+            variables: RwLock::new(Arc::new(variables)),
+        }
+    }
+
+    /// The variables to collect from a context
+    fn variables(&self) -> Arc<HashSet<String>> {
+        self.variables
+            .read()
+            .unwrap_or_else(|e| e.into_inner())
+            .clone()
+    }
+
+    /// Record a variable the program read that `Program::references` missed
+    fn add_variable(&self, name: &str) -> Arc<HashSet<String>> {
+        let mut variables = self.variables.write().unwrap_or_else(|e| e.into_inner());
+        if !variables.contains(name) {
+            Arc::make_mut(&mut *variables).insert(name.to_owned());
+        }
+        variables.clone()
+    }
+}
+
+/// Compile a CEL expression, mapping parse failures to a Python ValueError
+fn compile_program(src: &str) -> PyResult<CompiledProgram> {
+    Program::compile(src)
+        .map(CompiledProgram::new)
+        .map_err(|compile_error| {
             debug!("An error occurred during compilation");
             debug!("compile_error: {:?}", compile_error);
-            // compile_error
-            //     .into_iter()
-            //     .for_each(|e| println!("Parse error: {:?}", e));
-            return Err(PyValueError::new_err("Parse Error"));
-        }
-        Ok(program) => {
-            let mut environment = Context::default();
-
-            // Custom functions can be added to the environment
-            //environment.add_function("add", |a: i64, b: i64| a + b);
-
-            // Add any variables from the passed in Dict context
-            if let Some(context) = context {
-                for (key, value) in context {
-                    debug!("Adding context '{:?}'", key);
-                    let key = key.extract::<String>().unwrap();
+            PyValueError::new_err("Parse Error")
+        })
+}
+
+/// Compile a CEL expression, reusing a cached program where possible
+///
+/// Lookups borrow the caller's `&str` (PyO3 hands us a view of the Python string's
+/// UTF-8 buffer), so a cache hit neither copies nor allocates the expression source.
+fn compile_cached(src: &str) -> PyResult<Arc<CompiledProgram>> {
+    let Some(cache) = program_cache() else {
+        return compile_program(src).map(Arc::new);
+    };
+
+    {
+        let mut cache = cache.lock().unwrap_or_else(|e| e.into_inner());
+        if let Some(program) = cache.programs.get(src).cloned() {
+            cache.hits += 1;
+            return Ok(program);
+        }
+        cache.misses += 1;
+    }
+
+    // Compile without holding the lock so other threads aren't blocked on the parser
+    let program = Arc::new(compile_program(src)?);
+    cache
+        .lock()
+        .unwrap_or_else(|e| e.into_inner())
+        .programs
+        .put(src.to_string(), program.clone());
+    Ok(program)
+}
+
+/// A reusable evaluation context
+///
+/// Variables are converted to CEL values once, when they are added, so the same
+/// Context can be passed to `evaluate` many times without re-converting them.
+#[pyclass(name = "Context")]
+struct PyContext {
+    variables: HashMap<String, Value>,
+}
+
+#[pymethods]
+impl PyContext {
+    #[new]
+    #[pyo3(signature = (variables=None))]
+    fn new(variables: Option<&PyDict>) -> PyResult<Self> {
+        let mut context = PyContext {
+            variables: HashMap::new(),
+        };
+        if let Some(variables) = variables {
+            context.update(variables)?;
+        }
+        Ok(context)
+    }
+
+    /// Convert and add each item of a dict, replacing variables that already exist
+    /// Only the given items are converted; the rest of the context is left as is.
+    /// If any item fails to convert the context is not changed.
+    fn update(&mut self, variables: &PyDict) -> PyResult<()> {
+        let mut converted = Vec::with_capacity(variables.len());
+        for (key, value) in variables {
+            let key = key.extract::<String>()?;
+            let value = convert_value(&key, value)?;
+            converted.push((key, value));
+        }
+        self.variables.extend(converted);
+        Ok(())
+    }
+
+    /// Convert a Python value and add it to the context under `name`
+    fn add_variable(&mut self, name: String, value: &PyAny) -> PyResult<()> {
+        let value = convert_value(&name, value)?;
+        self.variables.insert(name, value);
+        Ok(())
+    }
+}
+
+/// Convert a single context value, mapping failures to a Python ValueError
+fn convert_value(key: &str, value: &PyAny) -> PyResult<Value> {
+    match RustyPyType(value).try_into_value() {
+        Ok(value) => {
+            debug!("Converted value: {:?}", value);
+            Ok(value)
+        }
+        Err(error) => {
+            debug!("An error occurred during context conversion");
+            debug!("Conversion error: {:?}", error);
+            debug!("Key: {:?}", key);
+
+            Err(PyValueError::new_err("Conversion Error"))
+        }
+    }
+}
+
+/// A context argument: a dict of Python values or a Context of converted values
+enum ContextSource<'py> {
+    Dict(&'py PyDict),
+    Context(PyRef<'py, PyContext>),
+}
+
+impl<'py> ContextSource<'py> {
+    fn new(context: &'py PyAny) -> PyResult<Self> {
+        // Plain dicts are the common case, so check for them before paying for a failed
+        // Context extraction
+        if let Ok(context) = context.downcast::<PyDict>() {
+            return Ok(ContextSource::Dict(context));
+        }
+        context
+            .extract::<PyRef<PyContext>>()
+            .map(ContextSource::Context)
+            .map_err(|_| PyTypeError::new_err("context must be a dict or Context"))
+    }
+
+    fn contains(&self, name: &str) -> PyResult<bool> {
+        match self {
+            ContextSource::Dict(context) => context.contains(name),
+            ContextSource::Context(context) => Ok(context.variables.contains_key(name)),
+        }
+    }
+
+    /// Look up a variable, converting it to a CEL value if it came from a dict
+    fn get(&self, name: &str) -> PyResult<Option<Value>> {
+        match self {
+            ContextSource::Dict(context) => match context.get_item(name)? {
+                Some(value) => {
+                    debug!("Adding context '{:?}'", name);
                     // Each value is of type PyAny, we need to try to extract into a Value
-                    // and then add it to the CEL context
-
-                    let wrapped_value = RustyPyType(value);
-                    match wrapped_value.try_into_value() {
-                        Ok(value) => {
-                            debug!("Converted value: {:?}", value);
-                            environment
-                                .add_variable(key, value)
-                                .expect("Failed to add variable to context");
-                        }
-                        Err(error) => {
-                            debug!("An error occurred during context conversion");
-                            debug!("Conversion error: {:?}", error);
-                            debug!("Key: {:?}", key);
+                    convert_value(name, value).map(Some)
+                }
+                None => Ok(None),
+            },
+            ContextSource::Context(context) => Ok(context.variables.get(name).cloned()),
+        }
+    }
+}
 
-                            return Err(PyValueError::new_err("Conversion Error"));
-                        }
+/// Collect the named variables from a context
+/// Only the named variables are looked up, so the others are neither converted nor
+/// copied into the interpreter's context.
+fn context_variables(
+    context: &ContextSource,
+    names: &HashSet<String>,
+) -> PyResult<Vec<(String, Value)>> {
+    let mut variables = Vec::with_capacity(names.len());
+    for name in names {
+        if let Some(value) = context.get(name)? {
+            variables.push((name.clone(), value));
+        }
+    }
+    Ok(variables)
+}
+
+/// Variables collected for one run of a program, and the names they were looked up by
+struct RunVariables {
+    variables: Vec<(String, Value)>,
+    names: Arc<HashSet<String>>,
+}
+
+/// Collect the variables for each program and context pair in a batch
+/// Each variable is converted at most once per context object, however many programs
+/// read it. Contexts are matched by identity, which is stable because the caller
+/// holds a reference to every context for the duration of the call.
+fn batch_context_variables<'a, 'py>(
+    items: impl IntoIterator<Item = (&'a Arc<CompiledProgram>, Option<&'py PyAny>)>,
+) -> PyResult<Vec<RunVariables>> {
+    let mut contexts: HashMap<usize, (ContextSource<'py>, HashMap<String, Option<Value>>)> =
+        HashMap::new();
+    let mut batch = Vec::new();
+    for (program, context) in items {
+        let names = program.variables();
+        let mut variables = Vec::new();
+        if let Some(context) = context {
+            let (source, converted) = match contexts.entry(context.as_ptr() as usize) {
+                Entry::Occupied(entry) => entry.into_mut(),
+                Entry::Vacant(entry) => {
+                    entry.insert((ContextSource::new(context)?, HashMap::new()))
+                }
+            };
+            for name in names.iter() {
+                let value = match converted.get(name) {
+                    Some(value) => value.clone(),
+                    None => {
+                        let value = source.get(name)?;
+                        converted.insert(name.clone(), value.clone());
+                        value
                     }
+                };
+                if let Some(value) = value {
+                    variables.push((name.clone(), value));
                 }
             }
+        }
+        batch.push(RunVariables { variables, names });
+    }
+    Ok(batch)
+}
 
-            let result = program.execute(&environment);
-            match result {
-                Err(error) => {
-                    println!("An error occurred during execution");
-                    println!("Execution error: {:?}", error);
-                    // errors
-                    //     .into_iter()
-                    //     .for_each(|e| println!("Execution error: {:?}", e));
-                    Err(PyValueError::new_err("Execution Error"))
-                }
+/// Run a compiled program against a set of variables
+/// Pure Rust, so callers may run it without holding the GIL
+fn run_program(program: &Program, variables: &[(String, Value)]) -> Result<Value, ExecutionError> {
+    let mut environment = Context::default();
 
-                Ok(value) => return Ok(RustyCelType(value)),
-            }
+    // Custom functions can be added to the environment
+    //environment.add_function("add", |a: i64, b: i64| a + b);
+
+    for (key, value) in variables {
+        environment
+            .add_variable(key.clone(), value.clone())
+            .expect("Failed to add variable to context");
+    }
+
+    program.execute(&environment)
+}
+
+/// Map an execution failure to a Python ValueError that reports its cause
+fn execution_error(error: ExecutionError) -> PyErr {
+    debug!("An error occurred during execution");
+    debug!("Execution error: {:?}", error);
+    PyValueError::new_err(format!("Execution Error: {}", error))
+}
+
+/// Convert the result of a run, retrying if it read a variable it wasn't given
+/// `Program::references` does not report every variable (for example an index such as
+/// `a[i]` or the middle operand of a ternary). When a run fails on a variable that is
+/// in the context but wasn't looked up, the name is added to the program's variables
+/// and the run is repeated. Other failures are returned unchanged.
+fn finish_run(
+    py: Python<'_>,
+    program: &CompiledProgram,
+    context: Option<&PyAny>,
+    names: Arc<HashSet<String>>,
+    result: Result<Value, ExecutionError>,
+) -> PyResult<RustyCelType> {
+    let mut names = names;
+    let mut result = result;
+    loop {
+        let (Err(ExecutionError::UndeclaredReference(name)), Some(context)) = (&result, context)
+        else {
+            break;
+        };
+        if names.contains(name.as_str()) {
+            break;
         }
+        let context = ContextSource::new(context)?;
+        if !context.contains(name)? {
+            break;
+        }
+        debug!("Variable {:?} was not in the program's references", name);
+        names = program.add_variable(name);
+        let variables = context_variables(&context, &names)?;
+        result = py.allow_threads(|| run_program(&program.program, &variables));
+    }
+    result.map(RustyCelType).map_err(execution_error)
+}
+
+/// Run a compiled program against an optional dict or Context
+fn execute_program(
+    py: Python<'_>,
+    program: &CompiledProgram,
+    context: Option<&PyAny>,
+) -> PyResult<RustyCelType> {
+    let names = program.variables();
+    let variables = match context {
+        Some(context) => context_variables(&ContextSource::new(context)?, &names)?,
+        None => Vec::new(),
+    };
+
+    // Conversion needs the GIL but running the program doesn't
+    let result = py.allow_threads(|| run_program(&program.program, &variables));
+    finish_run(py, program, context, names, result)
+}
+
+/// Evaluate a CEL expression
+/// Returns a String representation of the result
+#[pyfunction]
+fn evaluate(py: Python<'_>, src: &str, context: Option<&PyAny>) -> PyResult<RustyCelType> {
+    debug!("Evaluating CEL expression: {}", src);
+    debug!("Context: {:?}", context);
+
+    let program = compile_cached(src)?;
+    execute_program(py, &program, context)
+}
+
+/// Evaluate a batch of expressions
+/// Each item is either an `(expression, context)` pair or an expression string,
+/// which is evaluated against the shared `context`. A pair whose context is None
+/// also uses the shared `context`. Each distinct expression is compiled once per
+/// batch, each variable of a context is converted at most once, and the programs are
+/// run without holding the GIL. Returns a list of results in the same order.
+#[pyfunction]
+#[pyo3(signature = (items, context=None))]
+fn evaluate_many(
+    py: Python<'_>,
+    items: Vec<&PyAny>,
+    context: Option<&PyAny>,
+) -> PyResult<Vec<RustyCelType>> {
+    debug!("Evaluating {} CEL expressions", items.len());
+
+    let mut batch = Vec::with_capacity(items.len());
+    for item in items {
+        batch.push(match item.downcast::<PyString>() {
+            Ok(src) => (src.to_str()?, context),
+            Err(_) => {
+                let (src, item_context) = item.extract::<(&str, Option<&PyAny>)>()?;
+                (src, item_context.or(context))
+            }
+        });
+    }
+    let items = batch;
+
+    let mut programs: HashMap<&str, Arc<CompiledProgram>> = HashMap::new();
+    let mut compiled = Vec::with_capacity(items.len());
+    for &(src, _) in &items {
+        let program = match programs.get(src) {
+            Some(program) => program.clone(),
+            None => {
+                let program = compile_cached(src)?;
+                programs.insert(src, program.clone());
+                program
+            }
+        };
+        compiled.push(program);
+    }
+    let batch = batch_context_variables(
+        compiled
+            .iter()
+            .zip(items.iter().map(|&(_, context)| context)),
+    )?;
+
+    let results = py.allow_threads(|| {
+        compiled
+            .iter()
+            .zip(&batch)
+            .map(|(program, run)| run_program(&program.program, &run.variables))
+            .collect::<Vec<_>>()
+    });
+    results
+        .into_iter()
+        .zip(compiled.iter().zip(batch))
+        .zip(items)
+        .map(|((result, (program, run)), (_, context))| {
+            finish_run(py, program, context, run.names, result)
+        })
+        .collect()
+}
+
+/// A compiled CEL program that can be executed many times
+/// Programs are immutable, so the class is frozen and method calls skip PyO3's
+/// runtime borrow tracking.
+#[pyclass(name = "Program", frozen)]
+struct PyProgram {
+    program: Arc<CompiledProgram>,
+    source: String,
+}
+
+#[pymethods]
+impl PyProgram {
+    /// Execute the program against an optional dict or Context
+    #[pyo3(signature = (context=None))]
+    fn execute(&self, py: Python<'_>, context: Option<&PyAny>) -> PyResult<RustyCelType> {
+        execute_program(py, &self.program, context)
+    }
+
+    /// Execute the program once for each context
+    /// The contexts are converted first and the program is then run for all of them
+    /// without holding the GIL. Returns a list of results in the same order.
+    fn execute_many(
+        &self,
+        py: Python<'_>,
+        contexts: Vec<Option<&PyAny>>,
+    ) -> PyResult<Vec<RustyCelType>> {
+        let program = &self.program;
+        let batch = batch_context_variables(contexts.iter().map(|&context| (program, context)))?;
+
+        let results = py.allow_threads(|| {
+            batch
+                .iter()
+                .map(|run| run_program(&program.program, &run.variables))
+                .collect::<Vec<_>>()
+        });
+        results
+            .into_iter()
+            .zip(batch)
+            .zip(contexts)
+            .map(|((result, run), context)| finish_run(py, program, context, run.names, result))
+            .collect()
     }
+
+    /// The expression this program was compiled from
+    #[getter]
+    fn source(&self) -> &str {
+        &self.source
+    }
+
+    /// The names the program looks up in a context
+    /// Best effort: the names cel-interpreter reports when compiling, which can include
+    /// comprehension variables and miss some others, plus any names found at run time.
+    #[getter]
+    fn variables(&self, py: Python<'_>) -> PyResult<PyObject> {
+        Ok(PyFrozenSet::new_bound(py, self.program.variables().iter())?.into())
+    }
+
+    /// Pickle a program as its source expression
+    /// cel-interpreter has no serialized form for a compiled program, so unpickling
+    /// calls `compile` again with the stored source.
+    fn __reduce__(&self, py: Python<'_>) -> PyResult<(PyObject, (String,))> {
+        let compile = py.import_bound("cel")?.getattr("compile")?;
+        Ok((compile.unbind(), (self.source.clone(),)))
+    }
+
+    fn __repr__(&self) -> String {
+        format!("Program({:?})", self.source)
+    }
+}
+
+/// Compile a CEL expression into a Program that can be executed many times
+/// Shares the program cache with `evaluate`, so compiling a known expression is cheap
+#[pyfunction]
+fn compile(src: &str) -> PyResult<PyProgram> {
+    debug!("Compiling CEL expression: {}", src);
+    Ok(PyProgram {
+        program: compile_cached(src)?,
+        source: src.to_string(),
+    })
+}
+
+/// Clear the cache of compiled programs used by `evaluate` and `compile`
+#[pyfunction]
+fn cache_clear() {
+    if let Some(cache) = program_cache() {
+        let mut cache = cache.lock().unwrap_or_else(|e| e.into_inner());
+        cache.programs.clear();
+        cache.hits = 0;
+        cache.misses = 0;
+    }
+}
+
+/// Statistics for the compiled program cache used by `evaluate` and `compile`
+/// Returns a dict with `hits`, `misses`, `maxsize` and `currsize` keys
+#[pyfunction]
+fn cache_info() -> HashMap<&'static str, usize> {
+    let (hits, misses, maxsize, currsize) = match program_cache() {
+        Some(cache) => {
+            let cache = cache.lock().unwrap_or_else(|e| e.into_inner());
+            (
+                cache.hits,
+                cache.misses,
+                cache.programs.cap().get(),
+                cache.programs.len(),
+            )
+        }
+        None => (0, 0, 0, 0),
+    };
+    HashMap::from([
+        ("hits", hits),
+        ("misses", misses),
+        ("maxsize", maxsize),
+        ("currsize", currsize),
+    ])
 }
 
 /// A Python module implemented in Rust.
 #[pymodule]
 fn cel(_py: Python, m: &PyModule) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(evaluate, m)?)?;
+    m.add_function(wrap_pyfunction!(evaluate_many, m)?)?;
+    m.add_function(wrap_pyfunction!(compile, m)?)?;
+    m.add_function(wrap_pyfunction!(cache_clear, m)?)?;
+    m.add_function(wrap_pyfunction!(cache_info, m)?)?;
+    m.add_class::<PyContext>()?;
+    m.add_class::<PyProgram>()?;
     Ok(())
 }
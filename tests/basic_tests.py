@@ -9,6 +9,11 @@ def test_invalid_expression_raises_parse_value_error():
         result = cel.evaluate("1 +")
 
 
+def test_execution_error_reports_cause():
+    with pytest.raises(ValueError, match="^Execution Error: ."):
+        cel.evaluate("a + 1")
+
+
 def test_hello_world():
     assert cel.evaluate("'Hello ' + name", {'name': "World"}) == "Hello World"
 
@@ -83,3 +88,89 @@ def test_nested_context_expression():
         "claim": {"group": "hardbyte"}
     })
     assert result == True
+
+
+def test_repeated_expression_uses_program_cache():
+    cel.cache_clear()
+    assert cel.evaluate("a + 1", {'a': 1}) == 2
+    assert cel.evaluate("a + 1", {'a': 2}) == 3
+    info = cel.cache_info()
+    assert info['misses'] == 1
+    assert info['hits'] == 1
+    assert info['currsize'] == 1
+
+
+def test_cache_clear():
+    cel.evaluate("1 + 1")
+    cel.cache_clear()
+    assert cel.cache_info()['currsize'] == 0
+
+
+def test_context_object():
+    context = cel.Context({'a': 1})
+    context.add_variable('b', [2, 3])
+    assert cel.evaluate("a + b[1]", context) == 4
+    assert cel.evaluate("size(b)", context) == 2
+
+
+def test_invalid_context_type_raises_type_error():
+    with pytest.raises(TypeError):
+        cel.evaluate("a", [('a', 1)])
+
+
+def test_evaluate_many():
+    results = cel.evaluate_many([
+        ("a + 1", {'a': 1}),
+        ("a + 1", {'a': 2}),
+        ("'hello'", None),
+    ])
+    assert results == [2, 3, 'hello']
+
+
+def test_evaluate_many_invalid_expression_raises_value_error():
+    with pytest.raises(ValueError):
+        cel.evaluate_many([("1 +", None)])
+
+
+def test_dict_with_string_and_int_keys():
+    context = {"foo": {"bar": "baz", 1: "one"}}
+    assert cel.evaluate("foo['bar'] + foo[1]", context) == "bazone"
+
+
+def test_evaluate_many_shared_context():
+    results = cel.evaluate_many(["a + 1", "a * 2", ("a", {'a': 5})], {'a': 3})
+    assert results == [4, 6, 5]
+
+
+def test_evaluate_many_none_context_uses_shared_context():
+    items = ["a + 1", ("a + 2", None), ("a + 3", {'a': 10})]
+    assert cel.evaluate_many(items, {'a': 1}) == [2, 3, 13]
+
+
+def test_context_update():
+    context = cel.Context({'a': 1, 'b': 2})
+    context.update({'b': 20, 'c': 30})
+    assert cel.evaluate("a + b + c", context) == 51
+
+
+def test_failed_context_update_leaves_context_unchanged():
+    context = cel.Context({'a': 1})
+    with pytest.raises(ValueError):
+        context.update({'a': 2, 'b': object()})
+    assert cel.evaluate("a", context) == 1
+    with pytest.raises(ValueError):
+        cel.evaluate("b", context)
+
+
+def test_bool_context():
+    assert cel.evaluate("flag", {'flag': True}) is True
+    assert cel.evaluate("flag && other", {'flag': True, 'other': False}) is False
+
+
+def test_scalar_context_types():
+    context = {'i': 3, 'f': 1.5, 's': "x", 'b': b"ab", 'big': 2 ** 70}
+    assert cel.evaluate("i", context) == 3
+    assert cel.evaluate("f", context) == 1.5
+    assert cel.evaluate("s", context) == "x"
+    assert cel.evaluate("size(b)", context) == 2
+    assert cel.evaluate("big", context) == float(2 ** 70)
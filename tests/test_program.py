@@ -0,0 +1,107 @@
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import cel
+
+
+def test_compile_and_execute():
+    program = cel.compile("a + 1")
+    assert program.execute({'a': 1}) == 2
+    assert program.execute({'a': 41}) == 42
+
+
+def test_execute_without_context():
+    assert cel.compile("1 + 2").execute() == 3
+
+
+def test_execute_with_context_object():
+    program = cel.compile("name.startsWith('h')")
+    assert program.execute(cel.Context({'name': "hello"})) == True
+
+
+def test_execute_many():
+    program = cel.compile("a * 2")
+    assert program.execute_many([{'a': 1}, {'a': 2}, {'a': 3}]) == [2, 4, 6]
+
+
+def test_compile_invalid_expression_raises_value_error():
+    with pytest.raises(ValueError):
+        cel.compile("1 +")
+
+
+def test_execute_error_raises_value_error():
+    program = cel.compile("a + 1")
+    with pytest.raises(ValueError):
+        program.execute()
+
+
+def test_execute_many_repeated_context():
+    program = cel.compile("a + 1")
+    context = {'a': 1}
+    other = {'a': 10}
+    assert program.execute_many([context, other, context]) == [2, 11, 2]
+
+
+def test_program_source():
+    assert cel.compile("a + 1").source == "a + 1"
+
+
+def test_program_pickle_round_trip():
+    program = pickle.loads(pickle.dumps(cel.compile("a + 1")))
+    assert program.source == "a + 1"
+    assert program.execute({'a': 1}) == 2
+
+
+def test_execute_from_threads():
+    program = cel.compile("a * 2")
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda a: program.execute({'a': a}), range(100)))
+    assert results == [a * 2 for a in range(100)]
+
+
+def test_compile_shares_program_cache():
+    cel.cache_clear()
+    cel.evaluate("a + 2", {'a': 1})
+    assert cel.compile("a + 2").execute({'a': 2}) == 4
+    assert cel.cache_info()['hits'] == 1
+
+
+def test_program_variables():
+    program = cel.compile("resource.name.startsWith(prefix) && size(tags) > 0")
+    assert program.variables == frozenset({"resource", "prefix", "tags"})
+
+
+def test_unreferenced_context_values_are_not_converted():
+    # object() can't be converted to a CEL value, but the program never reads it
+    assert cel.compile("a + 1").execute({'a': 1, 'unused': object()}) == 2
+
+
+@pytest.mark.parametrize("expression,context,result", [
+    ("a[i]", {'a': [1, 2], 'i': 1}, 2),
+    ("c ? x : y", {'c': True, 'x': 1, 'y': 2}, 1),
+    ("{k: v}", {'k': "key", 'v': "value"}, {"key": "value"}),
+    ("xs.exists(e, e == t)", {'xs': [1, 2, 3], 't': 2}, True),
+])
+def test_nested_variables_are_found(expression, context, result):
+    cel.cache_clear()
+    assert cel.evaluate(expression, context) == result
+    cel.cache_clear()
+    assert cel.evaluate(expression, cel.Context(context)) == result
+    cel.cache_clear()
+    assert cel.compile(expression).execute_many([context, context]) == [result, result]
+
+
+def test_missing_variable_does_not_change_later_evaluations():
+    cel.cache_clear()
+    with pytest.raises(ValueError):
+        cel.evaluate("a + 1", {})
+    assert cel.evaluate("a + 1", {'a': 1, 'unused': object(), 2: "int key"}) == 2
+
+
+def test_program_variables_include_names_found_at_run_time():
+    cel.cache_clear()
+    program = cel.compile("c ? x : y")
+    assert program.execute({'c': True, 'x': 1, 'y': 2}) == 1
+    assert {"c", "x", "y"} <= program.variables